@@ -0,0 +1,53 @@
+"""
+Gzip Request Middleware
+Inflates request bodies sent with Content-Encoding: gzip
+"""
+import zlib
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Upper bound on an inflated request body, so a small upload can't expand without limit
+MAX_INFLATED_BYTES = 16 * 1024 * 1024
+
+
+class GZipRequestMiddleware:
+    """Pure ASGI middleware that decompresses gzip request bodies chunk by chunk as they arrive"""
+
+    def __init__(self, app: ASGIApp, max_size: int = MAX_INFLATED_BYTES):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = dict(scope["headers"]).get(b"content-encoding", b"")
+        if encoding.strip().lower() != b"gzip":
+            await self.app(scope, receive, send)
+            return
+
+        # Downstream sees a plain body: drop the encoding and the now-wrong length
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        inflated = 0
+
+        async def inflate_receive():
+            nonlocal inflated
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            # Errors raised here surface from the endpoint's body read, which FastAPI reports as 400
+            body = decompressor.decompress(message.get("body", b""), self.max_size - inflated + 1)
+            if not message.get("more_body", False):
+                body += decompressor.flush()
+            inflated += len(body)
+            if inflated > self.max_size or decompressor.unconsumed_tail:
+                raise ValueError(f"Decompressed request body exceeds {self.max_size} bytes")
+            return {**message, "body": body}
+
+        await self.app(scope, inflate_receive, send)
@@ -22,9 +22,10 @@ os.environ['TRANSFORMERS_NO_ADVISORY_WARNINGS'] = '1'
 os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
 
 from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import logging
 from pathlib import Path
@@ -67,6 +68,7 @@ from routers.config import router as config_router
 # Import middleware
 from middleware.request_id import RequestIDMiddleware
 from middleware.security import SecurityHeadersMiddleware
+from middleware.gzip_request import GZipRequestMiddleware
 
 # Phase 4 Services
 from services.context_manager import get_context_manager
@@ -94,6 +96,12 @@ app.add_middleware(SecurityHeadersMiddleware)
 # Request ID middleware (for tracing)
 app.add_middleware(RequestIDMiddleware)
 
+# Accept gzip-compressed request bodies (large, repetitive JSON payloads)
+app.add_middleware(GZipRequestMiddleware)
+
+# Compress JSON responses for clients that accept gzip; a mid level keeps CPU cost low on large dashboards
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # WebSocket manager
 class ConnectionManager:
     def __init__(self):
@@ -268,6 +276,40 @@ async def get_task(task_id: str):
         task['created_at'] = datetime.fromisoformat(task['created_at'])
     return task
 
+@api_router.get("/tasks/{task_id}/events")
+async def stream_task_events(task_id: str):
+    """Stream task status changes as Server-Sent Events until the task finishes"""
+    projection = {"_id": 0, "status": 1, "graph_state": 1}
+    task = await db.tasks.find_one({"id": task_id}, projection)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    async def event_stream(task):
+        last_sent = None
+        idle = 0
+        while task:
+            snapshot = {"status": task.get("status"), "graph_state": task.get("graph_state", {})}
+            if snapshot != last_sent:
+                yield f"data: {json.dumps(snapshot, default=str)}\n\n"
+                last_sent = snapshot
+                idle = 0
+            elif idle >= 21:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+                idle = 0
+            if snapshot["status"] in ("completed", "failed"):
+                return
+            await asyncio.sleep(1)
+            idle += 1
+            task = await db.tasks.find_one({"id": task_id}, projection)
+
+    return StreamingResponse(
+        event_stream(task),
+        media_type="text/event-stream",
+        # An explicit encoding keeps GZipMiddleware from buffering events inside the compressor
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Content-Encoding": "identity"}
+    )
+
 
 # ============================================
 # Run Inspector API Endpoints
@@ -3,6 +3,7 @@ GitHub Integration Service
 Handles GitHub operations: cloning, analyzing, pushing code, creating PRs
 """
 import logging
+import re
 import subprocess
 import os
 from typing import Dict, List, Optional
@@ -13,6 +14,11 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# owner/repo from HTTPS, SSH or bare "owner/repo" forms; a trailing ".git" or sub-path is ignored
+GITHUB_URL_RE = re.compile(
+    r"^(?:https?://github\.com/|git@github\.com:)?([^/\s]+)/([^/\s]+?)(?:\.git)?(?:/.*)?$"
+)
+
 
 class GitHubService:
     """
@@ -405,34 +411,19 @@ class GitHubService:
         Returns:
             Dictionary with owner and repo name
         """
-        try:
-            # Handle various GitHub URL formats
-            # https://github.com/owner/repo
-            # https://github.com/owner/repo.git
-            # git@github.com:owner/repo.git
-            
-            if github_url.startswith("git@github.com:"):
-                # SSH format
-                parts = github_url.replace("git@github.com:", "").replace(".git", "").split("/")
-            else:
-                # HTTPS format
-                parts = github_url.replace("https://github.com/", "").replace(".git", "").split("/")
-            
-            if len(parts) >= 2:
-                return {
-                    "owner": parts[0],
-                    "repo": parts[1],
-                    "full_name": f"{parts[0]}/{parts[1]}"
-                }
-            else:
-                return {
-                    "error": "Invalid GitHub URL format"
-                }
-                
-        except Exception as e:
+        # Handles https://github.com/owner/repo, https://github.com/owner/repo.git
+        # and git@github.com:owner/repo.git with one precompiled match
+        match = GITHUB_URL_RE.match(github_url.strip())
+        if not match:
             return {
-                "error": str(e)
+                "error": "Invalid GitHub URL format"
             }
+        owner, repo = match.groups()
+        return {
+            "owner": owner,
+            "repo": repo,
+            "full_name": f"{owner}/{repo}"
+        }
     
     def _prepare_clone_url(self, repo_url: str, token: Optional[str]) -> str:
         """Prepare clone URL with authentication token"""